@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from data_source_api.basic_document import BasicDocument, DocumentType
 from data_source_api.base_data_source import BaseDataSource, ConfigField, HTMLInputType
@@ -14,6 +14,11 @@ from requests.auth import AuthBase
 from urllib.parse import urljoin
 from time import sleep
 
+try:
+    import orjson as json
+except ImportError:
+    import json
+
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +37,8 @@ class BookStackAuth(AuthBase):
 class BookStack(Session):
     def __init__(self, url: str, token_id: str, token_secret: str, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.base_url = url
+        # API paths are absolute, so resolve against the host root like urljoin would
+        self.base_url = urljoin(url, "/").rstrip("/")
         self.auth = BookStackAuth(token_id, token_secret)
         self.rate_limit_reach = False
 
@@ -40,7 +46,7 @@ class BookStack(Session):
         while self.rate_limit_reach:
             sleep(1)
 
-        url = urljoin(self.base_url, url_path)
+        url = self.base_url + url_path
         r = super().request(method, url, verify=False, *args, **kwargs)
 
         if r.status_code != 200:
@@ -51,7 +57,7 @@ class BookStack(Session):
                     sleep(60)
                     self.rate_limit_reach = False
                     logger.info("Done waiting for the API rate limit")
-                return self.request(method, url, verify=False, *args, **kwargs)
+                return self.request(method, url_path, *args, **kwargs)
             r.raise_for_status()
         return r
 
@@ -68,31 +74,39 @@ class BookStack(Session):
         while records < total:
             r = self.get(url, params={"count": count, "offset": records, "sort": sort, **filters},
                          headers={"Content-Type": "application/json"})
-            json = r.json()
-            data += json.get("data")
+            response = json.loads(r.content)
+            data += response.get("data")
             records = len(data)
-            total = json.get("total")
+            total = response.get("total")
         return data
 
     def get_all_books(self) -> List[Dict]:
         return self.get_list("/api/books", sort="+updated_at")
 
-    def get_all_pages_from_book(self, book) -> List[Dict]:
-        pages = self.get_list("/api/pages", sort="+updated_at", filters={"book_id": book["id"]})
+    def get_all_pages(self, books: List[Dict], updated_since: Optional[datetime] = None) -> List[Dict]:
+        books_by_id = {book["id"]: book for book in books}
+
+        # Let the server skip pages that weren't updated since the given time
+        filters = None
+        if updated_since is not None:
+            filters = {"updated_at:gte": updated_since.strftime("%Y-%m-%d %H:%M:%S")}
+        pages = self.get_list("/api/pages", sort="+updated_at", filters=filters)
 
-        # Add parent book object to each page
+        # Add parent book object to each page, skipping pages of books we can't see
+        pages = [page for page in pages if page["book_id"] in books_by_id]
         for page in pages:
-            page.update({"book": book})
+            page.update({"book": books_by_id[page["book_id"]]})
 
         return pages
 
     def get_page(self, page_id: int):
         r = self.get(f"/api/pages/{page_id}", headers={"Content-Type": "application/json"})
-        return r.json()
+        return json.loads(r.content)
 
     def get_user(self, user_id: int):
         try:
-            return self.get(f"/api/users/{user_id}", headers={"Content-Type": "application/json"}).json()
+            r = self.get(f"/api/users/{user_id}", headers={"Content-Type": "application/json"})
+            return json.loads(r.content)
         # If the user lack the privileges to make this call, return None
         except HTTPError:
             return None
@@ -144,6 +158,15 @@ class BookstackDataSource(BaseDataSource):
         book_stack_config = BookStackConfig(**self._config)
         self._book_stack = BookStack(url=book_stack_config.url, token_id=book_stack_config.token_id,
                                      token_secret=book_stack_config.token_secret)
+        self._authors_cache: Dict[int, Optional[Dict]] = {}
+
+    def _get_author_details(self, author_id: int) -> Optional[Dict]:
+        # Failed lookups (usually a token without the manage-users permission) are cached as None too,
+        # the cache only lives for a single crawl so transient errors are retried on the next run
+        if author_id not in self._authors_cache:
+            self._authors_cache[author_id] = self._book_stack.get_user(author_id)
+
+        return self._authors_cache[author_id]
 
     def _list_books(self) -> List[Dict]:
         logger.info("Listing books with BookStack")
@@ -153,9 +176,7 @@ class BookstackDataSource(BaseDataSource):
         logger.info("Feeding new documents with BookStack")
 
         books = self._list_books()
-        raw_docs = []
-        for book in books:
-            raw_docs.extend(self._list_book_pages(book))
+        raw_docs = self._list_pages(books)
 
         parse_with_workers(self._parse_documents_worker, raw_docs)
 
@@ -163,6 +184,7 @@ class BookstackDataSource(BaseDataSource):
         logger.info(f"Worker parsing {len(raw_docs)} documents")
 
         parsed_docs = []
+        indexing_queue = IndexingQueue.get()
         total_fed = 0
         for raw_page in raw_docs:
             last_modified = datetime.strptime(raw_page["updated_at"], "%Y-%m-%dT%H:%M:%S.%fZ")
@@ -174,7 +196,7 @@ class BookstackDataSource(BaseDataSource):
             author_name = page_content["created_by"]["name"]
 
             author_image_url = ""
-            author = self._book_stack.get_user(raw_page["created_by"])
+            author = self._get_author_details(raw_page["created_by"])
             if author:
                 author_image_url = author["avatar_url"]
 
@@ -194,17 +216,17 @@ class BookstackDataSource(BaseDataSource):
                                              type=DocumentType.DOCUMENT))
             if len(parsed_docs) >= 50:
                 total_fed += len(parsed_docs)
-                IndexingQueue.get().feed(docs=parsed_docs)
+                indexing_queue.feed(docs=parsed_docs)
                 parsed_docs = []
 
-        IndexingQueue.get().feed(docs=parsed_docs)
+        indexing_queue.feed(docs=parsed_docs)
         total_fed += len(parsed_docs)
         if total_fed > 0:
             logging.info(f"Worker fed {total_fed} documents")
 
-    def _list_book_pages(self, book: Dict) -> List[Dict]:
-        logger.info(f"Getting documents from book {book['name']} ({book['id']})")
-        return self._book_stack.get_all_pages_from_book(book)
+    def _list_pages(self, books: List[Dict]) -> List[Dict]:
+        logger.info(f"Getting documents from {len(books)} books")
+        return self._book_stack.get_all_pages(books, updated_since=self._last_index_time)
 
 
 # if __name__ == "__main__":
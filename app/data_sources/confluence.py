@@ -1,3 +1,4 @@
+import concurrent.futures
 import logging
 from datetime import datetime
 from typing import List, Dict
@@ -77,8 +78,9 @@ class ConfluenceDataSource(BaseDataSource):
 
         spaces = self._list_spaces()
         raw_docs = []
-        for space in spaces:
-            raw_docs.extend(self._list_space_docs(space))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+            for space_docs in executor.map(self._list_space_docs, spaces):
+                raw_docs.extend(space_docs)
 
         parse_with_workers(self._parse_documents_worker, raw_docs)
 
@@ -86,6 +88,7 @@ class ConfluenceDataSource(BaseDataSource):
         logging.info(f'Worker parsing {len(raw_docs)} documents')
 
         parsed_docs = []
+        indexing_queue = IndexingQueue.get()
         total_fed = 0
         for raw_page in raw_docs:
             last_modified = datetime.strptime(raw_page['version']['when'], "%Y-%m-%dT%H:%M:%S.%fZ")
@@ -115,10 +118,10 @@ class ConfluenceDataSource(BaseDataSource):
                                              type=DocumentType.DOCUMENT))
             if len(parsed_docs) >= 50:
                 total_fed += len(parsed_docs)
-                IndexingQueue.get().feed(docs=parsed_docs)
+                indexing_queue.feed(docs=parsed_docs)
                 parsed_docs = []
 
-        IndexingQueue.get().feed(docs=parsed_docs)
+        indexing_queue.feed(docs=parsed_docs)
         total_fed += len(parsed_docs)
         if total_fed > 0:
             logging.info(f'Worker fed {total_fed} documents')
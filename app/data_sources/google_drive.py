@@ -1,7 +1,7 @@
 import json
-import os
 import io
 import logging
+import threading
 from datetime import datetime
 from typing import Dict, List
 from functools import lru_cache
@@ -17,6 +17,7 @@ from pydantic import BaseModel
 from data_source_api.base_data_source import BaseDataSource, ConfigField, HTMLInputType
 from data_source_api.basic_document import BasicDocument, DocumentType, FileType
 from data_source_api.exception import InvalidDataSourceConfig, KnownException
+from data_source_api.utils import parse_with_workers
 from indexing_queue import IndexingQueue
 from parsers.html import html_to_text
 from parsers.pptx import pptx_to_text
@@ -31,6 +32,8 @@ class GoogleDriveConfig(BaseModel):
 
 
 class GoogleDriveDataSource(BaseDataSource):
+    FEED_BATCH_SIZE = 50
+
     mime_type_to_parser = {
         'application/vnd.google-apps.document': html_to_text,
         'application/vnd.openxmlformats-officedocument.wordprocessingml.document': lambda content: html_to_text(docx_to_html(content)),
@@ -64,15 +67,23 @@ class GoogleDriveDataSource(BaseDataSource):
         parsed_config = GoogleDriveConfig(**self._config)
         json_dict = json.loads(parsed_config.json_str)
         self._credentials = ServiceAccountCredentials.from_json_keyfile_dict(json_dict, scopes=scopes)
-        self._http_auth = self._credentials.authorize(Http())
-        self._drive = build('drive', 'v3', http=self._http_auth)
-        
+        self._thread_local = threading.local()
+
         self._supported_mime_types = [
             'application/vnd.google-apps.document',
             'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
             'application/vnd.openxmlformats-officedocument.presentationml.presentation'
         ]
 
+    @property
+    def _drive(self):
+        # httplib2 isn't thread safe, so every worker thread gets its own drive client
+        drive = getattr(self._thread_local, 'drive', None)
+        if drive is None:
+            drive = build('drive', 'v3', http=self._credentials.authorize(Http()))
+            self._thread_local.drive = drive
+        return drive
+
     def _should_index_file(self, file):
         if file['mimeType'] not in self._supported_mime_types:
             logging.info(f"Skipping file {file['name']} because it's mime type is {file['mimeType']} which is not supported.")
@@ -100,7 +111,7 @@ class GoogleDriveDataSource(BaseDataSource):
     def _get_parents_string(self, file):
         return self._get_parent_name(file['parents'][0]) if file['parents'] else ''
 
-    def _index_files_from_drive(self, drive) -> List[dict]:        
+    def _index_files_from_drive(self, drive) -> None:
         is_shared_drive = drive['id'] is not None
 
         logging.info(f'Indexing drive {drive["name"]}')
@@ -132,15 +143,18 @@ class GoogleDriveDataSource(BaseDataSource):
 
         files = [file for file in files if self._should_index_file(file)]
 
-        documents = []
-
         logging.getLogger().info(f'Indexing {len(files)} documents from drive {drive["name"]}.')
 
+        parse_with_workers(self._parse_files_worker, files)
+
+    def _parse_files_worker(self, files: List[dict]) -> None:
+        documents = []
+        indexing_queue = IndexingQueue.get()
+
         for file in files:
             logging.getLogger().info(f'processing file {file["name"]}')
 
             file_id = file['id']
-            file_to_download = file['name']
             if file['mimeType'] == 'application/vnd.google-apps.document':
                 content = self._drive.files().export(fileId=file_id, mimeType='text/html').execute().decode('utf-8')
                 content = html_to_text(content)
@@ -153,20 +167,15 @@ class GoogleDriveDataSource(BaseDataSource):
                     while done is False:
                         status, done = downloader.next_chunk()
 
-                    # write the downloaded content to a file
-                    with open(file_to_download, 'wb') as f:
-                        f.write(fh.getbuffer())
-
+                    # parse the downloaded content straight from memory
+                    fh.seek(0)
                     if file['mimeType'] == 'application/vnd.openxmlformats-officedocument.presentationml.presentation':
-                        content = pptx_to_text(file_to_download)
+                        content = pptx_to_text(fh)
                     elif file['mimeType'] == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
-                        content = docx_to_html(file_to_download)
+                        content = docx_to_html(fh)
                         content = html_to_text(content)
                     else:
                         continue
-
-                    # delete file
-                    os.remove(file_to_download)
                 except Exception as error:
                     logging.exception(f'Error occurred parsing file "{file["name"]}" from google drive')
             
@@ -187,8 +196,11 @@ class GoogleDriveDataSource(BaseDataSource):
                 timestamp=last_modified,
                 file_type=FileType.from_mime_type(mime_type=file['mimeType'])
             ))
+            if len(documents) == GoogleDriveDataSource.FEED_BATCH_SIZE:
+                indexing_queue.feed(documents)
+                documents = []
 
-        IndexingQueue.get().feed(documents)
+        indexing_queue.feed(documents)
 
     def _get_all_drives(self) -> List[dict]:
         return [{'name': 'My Drive', 'id': None}] \
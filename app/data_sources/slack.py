@@ -2,7 +2,7 @@ import datetime
 import logging
 import time
 from dataclasses import dataclass
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Iterator
 
 from pydantic import BaseModel
 from slack_sdk import WebClient
@@ -17,12 +17,16 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class SlackConversation:
+    __slots__ = ('id', 'name')
+
     id: str
     name: str
 
 
 @dataclass
 class SlackAuthor:
+    __slots__ = ('name', 'image_url')
+
     name: str
     image_url: str
 
@@ -55,6 +59,7 @@ class SlackDataSource(BaseDataSource):
         slack_config = SlackConfig(**self._config)
         self._slack = WebClient(token=slack_config.token)
         self._authors_cache: Dict[str, SlackAuthor] = {}
+        self._last_index_unix = str(self._last_index_time.timestamp())
 
     def _list_conversations(self) -> List[SlackConversation]:
         conversations = self._slack.conversations_list(exclude_archived=True, limit=1000)
@@ -105,6 +110,7 @@ class SlackDataSource(BaseDataSource):
         last_msg: Optional[BasicDocument] = None
         total_fed = 0
         documents = []
+        indexing_queue = IndexingQueue.get()
 
         messages = self._fetch_conversation_messages(conv)
         for message in messages:
@@ -125,7 +131,7 @@ class SlackDataSource(BaseDataSource):
                     documents.append(last_msg)
                     if len(documents) == SlackDataSource.FEED_BATCH_SIZE:
                         total_fed += SlackDataSource.FEED_BATCH_SIZE
-                        IndexingQueue.get().feed(docs=documents)
+                        indexing_queue.feed(docs=documents)
                         documents = []
 
             timestamp = message['ts']
@@ -141,20 +147,18 @@ class SlackDataSource(BaseDataSource):
         if last_msg is not None:
             documents.append(last_msg)
 
-        IndexingQueue.get().feed(docs=documents)
+        indexing_queue.feed(docs=documents)
         total_fed += len(documents)
         if total_fed > 0:
             logger.info(f'Slack worker fed {total_fed} documents')
 
-    def _fetch_conversation_messages(self, conv):
-        messages = []
+    def _fetch_conversation_messages(self, conv) -> Iterator[Dict]:
         cursor = None
         has_more = True
-        last_index_unix = self._last_index_time.timestamp()
-        logger.info(f'Fetching messages for conversation {conv.name} since {last_index_unix}')
+        logger.info(f'Fetching messages for conversation {conv.name} since {self._last_index_unix}')
 
         while has_more:
-            response = self._slack.conversations_history(channel=conv.id, oldest=str(last_index_unix),
+            response = self._slack.conversations_history(channel=conv.id, oldest=self._last_index_unix,
                                                          limit=1000, cursor=cursor)
             if not response['ok'] and response['error'] == 'ratelimited':
                 retry_after_seconds = int(response['headers']['Retry-After'])
@@ -163,8 +167,6 @@ class SlackDataSource(BaseDataSource):
                 continue
 
             logger.info(f'Fetched {len(response["messages"])} messages for conversation {conv.name}')
-            messages.extend(response['messages'])
+            yield from response['messages']
             if has_more := response["has_more"]:
                 cursor = response["response_metadata"]["next_cursor"]
-
-        return messages
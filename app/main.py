@@ -11,6 +11,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi_restful.tasks import repeat_every
 from starlette.responses import Response
+from urllib3 import disable_warnings
+from urllib3.exceptions import InsecureRequestWarning
 
 from api.data_source import router as data_source_router
 from api.search import router as search_router
@@ -32,6 +34,10 @@ logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s | %(levelname)s | %(filename)s:%(lineno)d | %(message)s')
 logger = logging.getLogger(__name__)
 
+# Data sources (BookStack, Confluence) skip certificate verification, this silences
+# InsecureRequestWarning for the whole process rather than warning on every request
+disable_warnings(InsecureRequestWarning)
+
 app = FastAPI()
 
 
@@ -1,7 +1,11 @@
+from typing import BinaryIO, Union
+
 import mammoth
 
 
-def docx_to_html(input_filename: str) -> str:
-    with open(input_filename, "rb") as docx_file:
-        result = mammoth.convert_to_html(docx_file)
-        return result.value
+def docx_to_html(input_file: Union[str, BinaryIO]) -> str:
+    if isinstance(input_file, str):
+        with open(input_file, "rb") as docx_file:
+            return mammoth.convert_to_html(docx_file).value
+
+    return mammoth.convert_to_html(input_file).value
@@ -1,8 +1,10 @@
+from typing import BinaryIO, Union
+
 from pptx import Presentation
 
 
-def pptx_to_text(input_filename: str, slides_seperator: str = "\n\n") -> str:
-    presentation = Presentation(input_filename)
+def pptx_to_text(input_file: Union[str, BinaryIO], slides_seperator: str = "\n\n") -> str:
+    presentation = Presentation(input_file)
     presentation_text = ""
 
     for slide in presentation.slides: